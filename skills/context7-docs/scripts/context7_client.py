@@ -7,16 +7,55 @@ Fetches documentation for libraries using Context7's API endpoints.
 import os
 import sys
 import json
+import time
+import hashlib
 import argparse
-from typing import Optional, Dict, Any, Union
-import urllib.request
-import urllib.error
+import functools
+import threading
+import concurrent.futures
+from pathlib import Path
+from typing import Optional, Dict, Any, Tuple, Union
+import http.client
 import urllib.parse
 
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+CACHE_DIR = Path.home() / ".cache" / "context7"
+CACHE_TTL = 24 * 3600  # seconds before a cached response must be revalidated
+NEGATIVE_TTL = 3600  # shorter lifetime for cached 404s (typos, missing libraries)
+
+
+def _cache_path(url: str) -> Path:
+    return CACHE_DIR / f"{hashlib.sha1(url.encode()).hexdigest()}.json"
+
+
+def _read_cache(path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        return json.loads(path.read_text())
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def _write_cache(path: Path, entry: Dict[str, Any]) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(entry))
+        os.replace(tmp, path)
+    except OSError:
+        pass  # Caching is best-effort; never fail the request over it
+
 
 class Context7Client:
     """Client for interacting with Context7 API."""
 
+    __slots__ = ("api_key", "_host", "_local")
+
     BASE_URL = "https://context7.com/api/v1"
 
     def __init__(self, api_key: Optional[str] = None):
@@ -32,56 +71,116 @@ class Context7Client:
                 "Context7 API key required. Set CONTEXT7_API_KEY environment variable "
                 "or pass api_key parameter. Get key at: https://context7.com/dashboard"
             )
+        # Per-thread persistent connections so repeated calls reuse a TCP+TLS
+        # session and concurrent workers never share one connection
+        self._host = urllib.parse.urlsplit(self.BASE_URL).netloc
+        self._local = threading.local()
 
     def _make_request(self, url: str) -> Union[Dict[str, Any], str]:
-        """Make HTTP request to Context7 API with authentication."""
+        """Make HTTP request to Context7 API with authentication and on-disk caching.
+
+        Fresh cached responses are returned without a network call; stale ones
+        are revalidated with If-None-Match so a 304 avoids re-downloading the body.
+        """
+        cache_file = _cache_path(url)
+        cached = _read_cache(cache_file)
+        now = time.time()
+
+        if cached and now < cached.get("expires", 0):
+            if cached.get("status") == 404:
+                # Known-missing library; don't spend a round trip re-confirming
+                raise Exception("Library not found")
+            return cached["body"]
+
         headers = {
             "Authorization": f"Bearer {self.api_key}",
             "X-Context7-Source": "claude-skill",
         }
+        if cached and cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
 
-        req = urllib.request.Request(url, headers=headers)
+        split = urllib.parse.urlsplit(url)
+        path = f"{split.path}?{split.query}" if split.query else split.path
 
         try:
-            with urllib.request.urlopen(req) as response:
-                content_type = response.headers.get("Content-Type", "")
-                body = response.read().decode()
-
-                # Handle different content types
-                if "application/json" in content_type:
-                    return json.loads(body)
-                elif any(
-                    t in content_type
-                    for t in ["text/", "application/xml", "application/xhtml"]
-                ):
-                    # Return text content (markdown, plain text, html, xml, etc)
-                    return body
-                else:
-                    # Try JSON first, fallback to text
-                    try:
-                        return json.loads(body)
-                    except json.JSONDecodeError:
-                        return body
-
-        except urllib.error.HTTPError as e:
-            error_body = e.read().decode()
+            response, body = self._send(path, headers)
+        except (http.client.HTTPException, OSError) as e:
+            raise Exception(f"Network error: {e}")
+
+        status = response.status
+
+        if status == 304 and cached:
+            # Unchanged on the server; extend the cached entry's lifetime
+            cached["expires"] = now + CACHE_TTL
+            _write_cache(cache_file, cached)
+            return cached["body"]
+
+        if status >= 400:
+            error_body = body.decode()
             try:
                 error_data = json.loads(error_body)
-                if e.code == 429:
+                if status == 429:
                     retry_after = error_data.get("retryAfterSeconds", "unknown")
                     raise Exception(f"Rate limited. Retry after {retry_after} seconds")
-                elif e.code == 401:
+                elif status == 401:
                     raise Exception("Authentication failed. Check API key")
-                elif e.code == 404:
+                elif status == 404:
+                    _write_cache(
+                        cache_file, {"status": 404, "expires": now + NEGATIVE_TTL}
+                    )
                     raise Exception("Library not found")
                 else:
                     raise Exception(
-                        f"API error {e.code}: {error_data.get('error', error_body)}"
+                        f"API error {status}: {error_data.get('error', error_body)}"
                     )
             except json.JSONDecodeError:
-                raise Exception(f"HTTP {e.code}: {error_body}")
-        except urllib.error.URLError as e:
-            raise Exception(f"Network error: {e.reason}")
+                raise Exception(f"HTTP {status}: {error_body}")
+
+        content_type = response.headers.get("Content-Type", "")
+
+        # Handle different content types; JSON branches parse the raw bytes
+        # directly so large bodies never get an intermediate str copy
+        if "application/json" in content_type:
+            result = _loads(body)
+        elif any(
+            t in content_type for t in ["text/", "application/xml", "application/xhtml"]
+        ):
+            # Return text content (markdown, plain text, html, xml, etc)
+            result = body.decode()
+        else:
+            # Try JSON first, fallback to text
+            try:
+                result = _loads(body)
+            except json.JSONDecodeError:
+                result = body.decode()
+
+        _write_cache(
+            cache_file,
+            {
+                "etag": response.headers.get("ETag"),
+                "body": result,
+                "expires": now + CACHE_TTL,
+            },
+        )
+        return result
+
+    def _send(
+        self, path: str, headers: Dict[str, str]
+    ) -> Tuple[http.client.HTTPResponse, bytes]:
+        """Issue a GET on this thread's connection, reconnecting once if it went stale."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = http.client.HTTPSConnection(self._host)
+        for attempt in (0, 1):
+            try:
+                conn.request("GET", path, headers=headers)
+                response = conn.getresponse()
+                return response, response.read()
+            except (http.client.HTTPException, OSError):
+                conn.close()
+                conn = self._local.conn = http.client.HTTPSConnection(self._host)
+                if attempt:
+                    raise
 
     def search_library(self, library_name: str) -> Union[Dict[str, Any], str]:
         """
@@ -97,6 +196,7 @@ class Context7Client:
         url = f"{self.BASE_URL}/search?query={encoded_name}"
         return self._make_request(url)
 
+    @functools.lru_cache(maxsize=128)
     def get_docs(
         self, library_id: str, topic: Optional[str] = None, tokens: Optional[int] = None
     ) -> Union[Dict[str, Any], str]:
@@ -116,16 +216,15 @@ class Context7Client:
 
         url = f"{self.BASE_URL}/{library_id}"
 
-        # Add query parameters
-        params = {}
+        # Add query parameters; built by hand since only topic needs escaping
+        parts = []
         if topic:
-            params["topic"] = topic
+            parts.append(f"topic={urllib.parse.quote(topic, safe='')}")
         if tokens:
-            params["tokens"] = str(tokens)
+            parts.append(f"tokens={int(tokens)}")
 
-        if params:
-            query_string = urllib.parse.urlencode(params)
-            url = f"{url}?{query_string}"
+        if parts:
+            url = f"{url}?{'&'.join(parts)}"
 
         return self._make_request(url)
 
@@ -145,7 +244,11 @@ def main():
 
     # Docs command
     docs_parser = subparsers.add_parser("docs", help="Fetch documentation")
-    docs_parser.add_argument("library_id", help="Library ID (e.g., vercel/next.js)")
+    docs_parser.add_argument(
+        "library_id",
+        nargs="+",
+        help="Library ID(s) (e.g., vercel/next.js); multiple IDs are fetched concurrently",
+    )
     docs_parser.add_argument("--topic", help="Focus on specific topic")
     docs_parser.add_argument("--tokens", type=int, help="Max tokens to retrieve")
     docs_parser.add_argument("--json", action="store_true", help="Output raw JSON")
@@ -187,25 +290,41 @@ def main():
                     print(f"No results found for '{args.library_name}'")
 
         elif args.command == "docs":
-            result = client.get_docs(args.library_id, args.topic, args.tokens)
-
-            if args.json:
-                # Handle both string and dict responses for JSON output
-                if isinstance(result, str):
-                    print(json.dumps({"content": result}, indent=2))
-                else:
-                    print(json.dumps(result, indent=2))
-            else:
-                # Pretty print documentation
-                if isinstance(result, str):
-                    # Text response (markdown, html, plain text, etc)
-                    print(result)
-                elif isinstance(result, dict) and "content" in result:
-                    # JSON response with content field
-                    print(result["content"])
+            library_ids = args.library_id
+            # Fan out concurrently so N libraries cost ~one round trip, not N
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(8, len(library_ids))
+            ) as executor:
+                results = list(
+                    executor.map(
+                        lambda library_id: client.get_docs(
+                            library_id, args.topic, args.tokens
+                        ),
+                        library_ids,
+                    )
+                )
+
+            for library_id, result in zip(library_ids, results):
+                if len(library_ids) > 1:
+                    print(f"\n=== {library_id} ===\n")
+
+                if args.json:
+                    # Handle both string and dict responses for JSON output
+                    if isinstance(result, str):
+                        print(json.dumps({"content": result}, indent=2))
+                    else:
+                        print(json.dumps(result, indent=2))
                 else:
-                    # Unknown JSON structure
-                    print(json.dumps(result, indent=2))
+                    # Pretty print documentation
+                    if isinstance(result, str):
+                        # Text response (markdown, html, plain text, etc)
+                        print(result)
+                    elif isinstance(result, dict) and "content" in result:
+                        # JSON response with content field
+                        print(result["content"])
+                    else:
+                        # Unknown JSON structure
+                        print(json.dumps(result, indent=2))
 
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
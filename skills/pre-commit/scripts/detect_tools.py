@@ -8,26 +8,90 @@ Usage:
 Returns JSON with detected tools and suggested commands.
 """
 
+import concurrent.futures
+import functools
+import hashlib
 import json
 import os
 import sys
 from pathlib import Path
-from typing import Dict, Any
-
-
-def detect_javascript_tools(project_path: Path) -> Dict[str, Any]:
+from typing import Dict, Any, Set, Tuple
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+
+# Raw-byte tokens checked in package.json before paying for a full JSON parse
+_JS_TOKENS = {
+    "eslint": b'"eslint"',
+    "prettier": b'"prettier"',
+    "jest": b'"jest"',
+    "vitest": b'"vitest"',
+    "typescript": b'"typescript"',
+}
+
+# Tool-command tables, built once at import instead of per detector call
+_PY_TOOLS: Tuple[Tuple[str, str], ...] = (
+    ("black", "black --check ."),
+    ("flake8", "flake8 ."),
+    ("pylint", "pylint **/*.py"),
+    ("mypy", "mypy ."),
+    ("ruff", "ruff check ."),
+    ("pytest", "pytest"),
+    ("pyright", "pyright ."),
+)
+
+_GO_TOOLS = (
+    ("gofmt", "gofmt -l ."),
+    ("go-vet", "go vet ./..."),
+    ("go-test", "go test ./..."),
+)
+
+_RUST_TOOLS = (
+    ("rustfmt", "cargo fmt -- --check"),
+    ("clippy", "cargo clippy -- -D warnings"),
+    ("cargo-test", "cargo test"),
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _path_executables() -> Set[str]:
+    """Return the names of all executables found on PATH (scanned once per process)."""
+    executables = set()
+    for directory in os.environ.get("PATH", "").split(os.pathsep):
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_file() and os.access(entry.path, os.X_OK):
+                        executables.add(entry.name)
+        except OSError:
+            continue
+    return executables
+
+
+def detect_javascript_tools(project_path: Path, present: Set[str]) -> Dict[str, Any]:
     """Detect JavaScript/TypeScript tools."""
     tools = {}
 
-    package_json = project_path / "package.json"
-    if not package_json.exists():
+    if "package.json" not in present:
         return tools
 
+    package_json = project_path / "package.json"
+
     try:
-        import json as json_lib
+        data = package_json.read_bytes()
 
-        with open(package_json) as f:
-            package_data = json_lib.load(f)
+        # Cheap substring pre-pass: if no tool token and no scripts section
+        # appears anywhere in the raw bytes, skip JSON parsing entirely
+        candidates = {name for name, token in _JS_TOKENS.items() if token in data}
+        if not candidates and b'"scripts"' not in data:
+            return tools
+
+        package_data = _loads(data)
 
         scripts = package_data.get("scripts", {})
         dev_deps = package_data.get("devDependencies", {})
@@ -56,86 +120,130 @@ def detect_javascript_tools(project_path: Path) -> Dict[str, Any]:
     return tools
 
 
-def detect_python_tools(project_path: Path) -> Dict[str, Any]:
+def detect_python_tools(project_path: Path, present: Set[str]) -> Dict[str, Any]:
     """Detect Python tools."""
     tools = {}
 
     # Check for config files
-    pyproject_toml = project_path / "pyproject.toml"
-    setup_py = project_path / "setup.py"
-    requirements = project_path / "requirements.txt"
-
-    if not (pyproject_toml.exists() or setup_py.exists() or requirements.exists()):
+    if not present & {"pyproject.toml", "setup.py", "requirements.txt"}:
         return tools
 
-    # Common Python tools
-    common_tools = {
-        "black": "black --check .",
-        "flake8": "flake8 .",
-        "pylint": "pylint **/*.py",
-        "mypy": "mypy .",
-        "ruff": "ruff check .",
-        "pytest": "pytest",
-        "pyright": "pyright .",
-    }
-
-    for tool, command in common_tools.items():
+    for tool, command in _PY_TOOLS:
         # Check if tool is available in PATH
-        if os.system(f"which {tool} > /dev/null 2>&1") == 0:
+        if tool in _path_executables():
             tools[tool] = command
 
     return tools
 
 
-def detect_go_tools(project_path: Path) -> Dict[str, Any]:
+def detect_go_tools(project_path: Path, present: Set[str]) -> Dict[str, Any]:
     """Detect Go tools."""
     tools = {}
 
-    go_mod = project_path / "go.mod"
-    if not go_mod.exists():
+    if "go.mod" not in present:
         return tools
 
-    tools["gofmt"] = "gofmt -l ."
-    tools["go-vet"] = "go vet ./..."
-    tools["go-test"] = "go test ./..."
+    tools.update(_GO_TOOLS)
 
     # Check for golangci-lint
-    if os.system("which golangci-lint > /dev/null 2>&1") == 0:
+    if "golangci-lint" in _path_executables():
         tools["golangci-lint"] = "golangci-lint run"
 
     return tools
 
 
-def detect_rust_tools(project_path: Path) -> Dict[str, Any]:
+def detect_rust_tools(project_path: Path, present: Set[str]) -> Dict[str, Any]:
     """Detect Rust tools."""
     tools = {}
 
-    cargo_toml = project_path / "Cargo.toml"
-    if not cargo_toml.exists():
+    if "Cargo.toml" not in present:
         return tools
 
-    tools["rustfmt"] = "cargo fmt -- --check"
-    tools["clippy"] = "cargo clippy -- -D warnings"
-    tools["cargo-test"] = "cargo test"
+    tools.update(_RUST_TOOLS)
 
     return tools
 
 
+# Every file the detectors consult must be keyed, or the cache serves stale results
+_MANIFESTS = (
+    "package.json",
+    "pyproject.toml",
+    "setup.py",
+    "requirements.txt",
+    "go.mod",
+    "Cargo.toml",
+)
+
+
+def _cache_key(project_path: Path) -> str:
+    """Hash of project path, manifest mtimes, and PATH; changes invalidate the cache."""
+    stats = tuple(
+        _mtime_or_zero(project_path / name) for name in _MANIFESTS
+    ) + (str(project_path), os.environ.get("PATH", ""))
+    return hashlib.sha1(repr(stats).encode()).hexdigest()
+
+
+def _mtime_or_zero(path: Path) -> float:
+    try:
+        return path.stat().st_mtime
+    except FileNotFoundError:
+        return 0
+
+
 def main():
     project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".")
     project_path = project_path.resolve()
 
+    # Opt-in persistent cache: warm invocations skip detection entirely.
+    use_cache = os.environ.get("DETECT_TOOLS_CACHE") == "1"
+    cache_file = None
+    if use_cache:
+        cache_dir = Path.home() / ".cache" / "claude-code" / "detect_tools"
+        cache_file = cache_dir / f"{_cache_key(project_path)}.json"
+        try:
+            print(cache_file.read_text(), end="")
+            return
+        except OSError:
+            pass
+
     all_tools = {}
 
-    # Detect tools for different languages
-    all_tools.update(detect_javascript_tools(project_path))
-    all_tools.update(detect_python_tools(project_path))
-    all_tools.update(detect_go_tools(project_path))
-    all_tools.update(detect_rust_tools(project_path))
+    # One directory read captures which config files exist; detectors then
+    # test membership instead of issuing a stat per file.
+    try:
+        present = {entry.name for entry in os.scandir(project_path) if entry.is_file()}
+    except OSError:
+        present = set()
+
+    # Detect tools for different languages concurrently; each detector only
+    # does filesystem stats, so threads overlap the I/O latency.
+    detectors = [
+        detect_javascript_tools,
+        detect_python_tools,
+        detect_go_tools,
+        detect_rust_tools,
+    ]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(
+            executor.map(lambda detect: detect(project_path, present), detectors)
+        )
+
+    for result in results:
+        all_tools.update(result)
 
     result = {"project_path": str(project_path), "tools": all_tools}
-
-    print(json.dumps(result, indent=2))
+    output = json.dumps(result, indent=2)
+
+    if cache_file is not None:
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(".tmp")
+            tmp_file.write_text(output + "\n")
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            pass  # Caching is best-effort; the result must still print
+
+    print(output)
 
 
 if __name__ == "__main__":